@@ -1064,25 +1064,39 @@ class Logger(Sink, Block):
     
     def write(self, *values):
 
-        # stack first
-        stack_values = numpy.hstack(values)
+        # recalculate index?
+        dims = None
+        if self.index is None and self.labels is not None:
+            assert len(self.labels) == len(values)
+            dims = tuple(Logger.len(x) for x in values)
+
+        # stack and log
+        self.write_row(numpy.hstack(values), dims)
+
+    def write_row(self, row, dims = None):
+        """
+        Write a flat row with the values of all inputs to the log
+        using a single slice assignment.
+
+        :param numpy.ndarray row: flat row with the values of all inputs
+        :param tuple dims: number of entries of each input in `row` (default None)
+        """
 
         # reshape?
         _shape = self.data.shape
         if not isinstance(_shape, tuple):
             _shape = _shape()
-        if _shape[1] != len(stack_values):
+        if _shape[1] != len(row):
             # reshape log
-            self.reshape(_shape[0], len(stack_values))
+            self.reshape(_shape[0], len(row))
 
         # recalculate index?
-        if self.index is None and self.labels is not None:
-            assert len(self.labels) == len(values)
-            dims = tuple(Logger.len(x) for x in values)
+        if self.index is None and self.labels is not None and dims is not None:
+            assert len(self.labels) == len(dims)
             self.index = (0,) + tuple(itertools.accumulate(dims))
         
         # Log data
-        self.data[self.current, :] = stack_values
+        self.data[self.current, :] = row
 
         if self.current < _shape[0] - 1:
             # increment current pointer
@@ -19,6 +19,7 @@ except ImportError:
 
 from threading import Thread, Timer, Condition
 from time import sleep
+from operator import itemgetter
 import re
 
 try:
@@ -28,6 +29,7 @@ except ImportError:
 
 from .. import block
 from .. import BlockType
+from .table import SignalTable
 
 
 class ContainerWarning(block.BlockWarning):
@@ -38,6 +40,23 @@ class ContainerException(block.BlockException):
     pass
 
 
+def getter(labels):
+    """
+    Return a function that retrieves the values of the signals in
+    :py:data:`labels` from a dictionary as a tuple.
+
+    :param list labels: the signal labels
+    :return: function that takes a dictionary and returns a tuple
+    """
+    if len(labels) == 0:
+        return lambda signals: ()
+    elif len(labels) == 1:
+        label = labels[0]
+        return lambda signals: (signals[label],)
+    else:
+        return itemgetter(*labels)
+
+
 class Input(block.Source, block.BufferBlock):
     """
     :py:class:`pyctrl.block.container.Input` provides a block that connects a container input signals to local container signals .
@@ -59,10 +78,19 @@ class Output(block.Sink, block.BufferBlock):
 class Container(block.Filter, block.Block):
     """
     :py:class:`pyctrl.block.container.Container` provides a block that can contain other blocks.
+
+    If :py:attr:`signal_table` is True signals are stored in a
+    :py:class:`pyctrl.block.table.SignalTable` instead of a
+    dictionary. Signals must then be numeric.
+
+    :param bool signal_table: store signals in a :py:class:`pyctrl.block.table.SignalTable` (default False)
     """
 
     def __init__(self, **kwargs):
 
+        # signal table
+        self.signal_table = kwargs.pop('signal_table', False)
+
         # set enabled as False by default
         if 'enabled' not in kwargs:
             kwargs['enabled'] = False
@@ -81,7 +109,10 @@ class Container(block.Filter, block.Block):
             sleep(1)
 
         # signals
-        self.signals = {}
+        if self.signal_table:
+            self.signals = SignalTable(on_relayout=self.invalidate)
+        else:
+            self.signals = {}
 
         # sources
         self.sources = {}
@@ -99,6 +130,9 @@ class Container(block.Filter, block.Block):
         self.timers = {}
         self.running_timers = {}
 
+        # execution plan
+        self.plan = None
+
     # reset
     def reset(self):
         """
@@ -120,7 +154,25 @@ class Container(block.Filter, block.Block):
 
     # get
     def get(self, *keys, exclude=()):
-        return super().get(*keys, exclude=exclude + ("running_timers",))
+
+        retval = super().get(*keys, exclude=exclude + ("running_timers", "plan"))
+
+        # signal tables are returned as dictionaries
+        if isinstance(self.signals, SignalTable):
+            if len(keys) == 1:
+                if keys[0] == 'signals':
+                    retval = self.signals.copy()
+            elif 'signals' in retval:
+                retval['signals'] = self.signals.copy()
+
+        return retval
+
+    def invalidate(self):
+        """
+        Invalidate the execution plan so that it is compiled again
+        on the next call to :py:meth:`pyctrl.block.container.Container.run`.
+        """
+        self.plan = None
 
     def html(self, *keys):
         """
@@ -645,6 +697,9 @@ class Container(block.Filter, block.Block):
         else:
             self.sources_order.insert(order, label)
 
+        # invalidate plan
+        self.invalidate()
+
         # reference parent
         source.set_parent(self)
 
@@ -670,6 +725,9 @@ class Container(block.Filter, block.Block):
         self.sources_order.remove(label)
         self.sources.pop(label)
 
+        # invalidate plan
+        self.invalidate()
+
     def set_source(self, label, **kwargs):
         """
         Set source attributes. Call method :py:meth:`pyctrl.block.Block.set`.
@@ -690,6 +748,11 @@ class Container(block.Filter, block.Block):
         if label not in self.sources:
             raise ContainerException("Source '{}' does not exist".format(label))
 
+        # invalidate plan if topology changed
+        if 'inputs' in kwargs or 'outputs' in kwargs \
+           or 'enable' in kwargs or 'enabled' in kwargs:
+            self.invalidate()
+
         if 'outputs' in kwargs:
             values = kwargs.pop('outputs')
             assert isinstance(values, (list, tuple))
@@ -836,6 +899,9 @@ class Container(block.Filter, block.Block):
         else:
             self.sinks_order.insert(order, label)
 
+        # invalidate plan
+        self.invalidate()
+
         # reference parent
         sink.set_parent(self)
 
@@ -861,6 +927,9 @@ class Container(block.Filter, block.Block):
         self.sinks_order.remove(label)
         self.sinks.pop(label)
 
+        # invalidate plan
+        self.invalidate()
+
     def set_sink(self, label, **kwargs):
         """
         Set sink attributes. Call method :py:meth:`pyctrl.block.Block.set`.
@@ -881,6 +950,11 @@ class Container(block.Filter, block.Block):
         if label not in self.sinks:
             raise ContainerException("Sink '{}' does not exist".format(label))
 
+        # invalidate plan if topology changed
+        if 'inputs' in kwargs or 'outputs' in kwargs \
+           or 'enable' in kwargs or 'enabled' in kwargs:
+            self.invalidate()
+
         if 'inputs' in kwargs:
             values = kwargs.pop('inputs')
             assert isinstance(values, (list, tuple))
@@ -1085,6 +1159,9 @@ class Container(block.Filter, block.Block):
         else:
             self.filters_order.insert(order, label)
 
+        # invalidate plan
+        self.invalidate()
+
         # reference parent
         filter_.set_parent(self)
 
@@ -1117,6 +1194,9 @@ class Container(block.Filter, block.Block):
         self.filters_order.remove(label)
         self.filters.pop(label)
 
+        # invalidate plan
+        self.invalidate()
+
     def set_filter(self, label, **kwargs):
         """
         Set filter attributes. Call method :py:meth:`pyctrl.block.Block.set`.
@@ -1138,6 +1218,11 @@ class Container(block.Filter, block.Block):
         if label not in self.filters:
             raise ContainerException("Filter '{}' does not exist".format(label))
 
+        # invalidate plan if topology changed
+        if 'inputs' in kwargs or 'outputs' in kwargs \
+           or 'enable' in kwargs or 'enabled' in kwargs:
+            self.invalidate()
+
         if 'inputs' in kwargs:
             values = kwargs.pop('inputs')
             assert isinstance(values, (list, tuple))
@@ -1585,20 +1670,97 @@ class Container(block.Filter, block.Block):
 
         return buffer
 
+    def compile(self):
+        """
+        Compile the execution plan used by :py:meth:`pyctrl.block.container.Container.run`.
+
+        The plan resolves the order of execution, the block references
+        and the input and output signals of all sources, filters and
+        sinks, so that no label lookups are needed while running. It
+        is compiled on demand and invalidated whenever sources,
+        filters or sinks are added, removed, or have their inputs,
+        outputs or enabled state changed.
+
+        If :py:attr:`signal_table` is True inputs and outputs are
+        moved using the integer slot indices of the
+        :py:class:`pyctrl.block.table.SignalTable` and sinks which
+        implement `write_row`, such as
+        :py:class:`pyctrl.block.Logger`, receive all their inputs in
+        a single preallocated row.
+
+        :return: tuple with the plan for sources, filters and sinks
+        """
+
+        signals = self.signals
+
+        if self.signal_table:
+
+            # make sure signals are in a table
+            if not isinstance(signals, SignalTable):
+                signals = self.signals = SignalTable(signals,
+                                                     on_relayout=self.invalidate)
+            signals.compact()
+
+            getter_ = signals.getter
+            setter = signals.setter
+
+            def sink(blk, labels):
+                # sinks that accept rows get all inputs at once
+                if hasattr(blk, 'write_row'):
+                    return (blk, blk.write_row, signals.gather(labels))
+                return (blk, blk.write, signals.getter(labels))
+
+        else:
+
+            def getter_(labels):
+                get = getter(labels)
+                return lambda: get(signals)
+
+            def setter(labels):
+                return lambda values: signals.update(zip(labels, values))
+
+            def sink(blk, labels):
+                return (blk, blk.write, getter_(labels))
+
+        sources = tuple((self.sources[label]['block'],
+                         setter(self.sources[label]['outputs']))
+                        for label in self.sources_order)
+
+        filters = tuple((self.filters[label]['block'],
+                         getter_(self.filters[label]['inputs']),
+                         setter(self.filters[label]['outputs']))
+                        for label in self.filters_order)
+
+        sinks = tuple(sink(self.sinks[label]['block'],
+                           self.sinks[label]['inputs'])
+                      for label in self.sinks_order)
+
+        self.plan = (sources, filters, sinks)
+
+        return self.plan
+
     def run(self):
 
+        # compile plan if needed
+        plan = self.plan
+        if plan is None:
+            plan = self.compile()
+        (sources, filters, sinks) = plan
+
         # profiling
         t0 = 0
         first = True
 
         # Read all sources
-        for label in self.sources_order:
-            block = self.sources[label]
-            source = block['block']
+        k = 0
+        while k < len(sources):
+            (source, outputs) = sources[k]
+            k += 1
             if source.is_enabled():
                 # retrieve outputs
-                self.signals.update(dict(zip(block['outputs'],
-                                             source.read())))
+                if outputs(source.read()):
+                    # signals were relocated
+                    (sources, filters, sinks) = self.compile()
 
                 # Begin profiling
                 if first:
@@ -1606,25 +1768,23 @@ class Container(block.Filter, block.Block):
                     first = False
 
         # Process all filters
-        for label in self.filters_order:
-            block = self.filters[label]
-            fltr = block['block']
+        k = 0
+        while k < len(filters):
+            (fltr, inputs, outputs) = filters[k]
+            k += 1
             if fltr.is_enabled():
                 # write signals to inputs
-                fltr.write(*[self.signals[label]
-                             for label in block['inputs']])
+                fltr.write(*inputs())
                 # retrieve outputs
-                self.signals.update(dict(zip(block['outputs'],
-                                             fltr.read())))
+                if outputs(fltr.read()):
+                    # signals were relocated
+                    (sources, filters, sinks) = self.compile()
 
         # Write to all sinks
-        for label in self.sinks_order:
-            block = self.sinks[label]
-            sink = block['block']
+        for (sink, write, inputs) in sinks:
             if sink.is_enabled():
                 # write inputs
-                sink.write(*[self.signals[label]
-                             for label in block['inputs']])
+                write(*inputs())
 
         # return duty time
         return perf_counter() - t0
@@ -0,0 +1,288 @@
+"""
+This module provides an array-backed table for storing container signals.
+"""
+
+import numpy
+
+from .. import block
+
+
+class SignalTable:
+    """
+    :py:class:`pyctrl.block.table.SignalTable` stores scalar and
+    fixed-shape vector signals in a single preallocated
+    :py:class:`numpy.ndarray` of type `float64` with named slots.
+
+    A :py:class:`pyctrl.block.table.SignalTable` behaves like a
+    dictionary of signals, so that signals can still be read and
+    written by name. Its purpose is to let
+    :py:class:`pyctrl.block.container.Container` compile functions
+    that move signal values in and out of blocks using integer slot
+    indices, see :py:meth:`pyctrl.block.table.SignalTable.getter`,
+    :py:meth:`pyctrl.block.table.SignalTable.setter` and
+    :py:meth:`pyctrl.block.table.SignalTable.gather`.
+
+    The shape of a signal is set by the first value assigned to
+    it. Assigning a value with a different shape relocates the
+    signal's slot, which changes the table :py:attr:`layout` and
+    calls :py:attr:`on_relayout`.
+
+    :param signals: dictionary with initial signals (default None)
+    :param int capacity: initial number of entries in the buffer (default 64)
+    :param on_relayout: function called whenever slots are relocated (default None)
+    """
+
+    def __init__(self, signals=None, capacity=64, on_relayout=None):
+
+        self.buffer = numpy.zeros(max(capacity, 1), dtype=numpy.float64)
+        self.slots = {}
+        self.size = 0
+        self.layout = 0
+        self.on_relayout = on_relayout
+
+        if signals:
+            self.update(signals)
+
+    def _relayout(self):
+
+        self.layout += 1
+        if self.on_relayout is not None:
+            self.on_relayout()
+
+    def _allocate(self, label, shape):
+
+        length = int(numpy.prod(shape))
+
+        # grow buffer?
+        if self.size + length > self.buffer.shape[0]:
+            buffer = numpy.zeros(max(2 * self.buffer.shape[0], self.size + length),
+                                 dtype=numpy.float64)
+            buffer[:self.size] = self.buffer[:self.size]
+            self.buffer = buffer
+
+        # allocate slot at the end of the buffer
+        slot = (self.size, self.size + length, shape)
+        self.slots[label] = slot
+        self.size += length
+
+        self._relayout()
+
+        return slot
+
+    def compact(self):
+        """
+        Remove gaps left by removed or relocated signals.
+        """
+
+        if self.size == sum(stop - start for (start, stop, shape) in self.slots.values()):
+            return
+
+        buffer = numpy.zeros(max(self.buffer.shape[0], 1), dtype=numpy.float64)
+        slots = {}
+        size = 0
+        for (label, (start, stop, shape)) in self.slots.items():
+            length = stop - start
+            buffer[size:size + length] = self.buffer[start:stop]
+            slots[label] = (size, size + length, shape)
+            size += length
+
+        self.buffer, self.slots, self.size = buffer, slots, size
+
+        self._relayout()
+
+    # dictionary interface
+
+    def __setitem__(self, label, value):
+
+        try:
+            value = numpy.asarray(value, dtype=numpy.float64)
+        except (TypeError, ValueError):
+            raise block.BlockException("Signal '{}' must be numeric to be stored in a SignalTable".format(label))
+
+        slot = self.slots.get(label)
+        if slot is None or slot[2] != value.shape:
+            slot = self._allocate(label, value.shape)
+
+        (start, stop, shape) = slot
+        if shape == ():
+            self.buffer[start] = value
+        else:
+            self.buffer[start:stop] = value.ravel()
+
+    def __getitem__(self, label):
+
+        (start, stop, shape) = self.slots[label]
+        if shape == ():
+            return float(self.buffer[start])
+        else:
+            return self.buffer[start:stop].reshape(shape).copy()
+
+    def __delitem__(self, label):
+
+        del self.slots[label]
+        self._relayout()
+
+    def __contains__(self, label):
+        return label in self.slots
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def keys(self):
+        return self.slots.keys()
+
+    def values(self):
+        return [self[label] for label in self.slots]
+
+    def items(self):
+        return [(label, self[label]) for label in self.slots]
+
+    def get(self, label, default=None):
+        if label in self.slots:
+            return self[label]
+        return default
+
+    def pop(self, label, *default):
+        if label not in self.slots:
+            if default:
+                return default[0]
+            raise KeyError(label)
+        value = self[label]
+        del self[label]
+        return value
+
+    def update(self, *vargs, **kwargs):
+        for (label, value) in dict(*vargs, **kwargs).items():
+            self[label] = value
+
+    def copy(self):
+        """
+        Return a copy of the signals as a dictionary.
+        """
+        return dict(self.items())
+
+    def view(self, label):
+        """
+        Return a view of the slot of signal :py:data:`label`.
+
+        The view is only valid until the next change of :py:attr:`layout`.
+
+        :param str label: the signal label
+        :return: a view of the signal slot
+        :rtype: numpy.ndarray
+        """
+        (start, stop, shape) = self.slots[label]
+        return self.buffer[start:stop].reshape(shape)
+
+    # compiled access
+
+    def getter(self, labels):
+        """
+        Return a function that retrieves the values of the signals in
+        :py:data:`labels` as a tuple using their slot indices.
+
+        Scalar signals are returned as floats and vector signals as
+        copies of their slots.
+
+        :param list labels: the signal labels
+        :return: function with no arguments
+        """
+
+        buffer = self.buffer
+        slots = tuple(self.slots[label] for label in labels)
+
+        if all(shape == () for (start, stop, shape) in slots):
+            index = numpy.array([start for (start, stop, shape) in slots],
+                                dtype=numpy.intp)
+            return lambda: buffer.take(index).tolist()
+
+        def get():
+            return tuple(buffer[start] if shape == ()
+                         else buffer[start:stop].reshape(shape).copy()
+                         for (start, stop, shape) in slots)
+
+        return get
+
+    def setter(self, labels):
+        """
+        Return a function that stores values on the slots of the
+        signals in :py:data:`labels`.
+
+        Values whose shapes do not match their slots are stored by
+        name, which relocates their slots. The function returns True
+        if any slot was relocated, in which case functions previously
+        returned by this table are no longer valid.
+
+        :param list labels: the signal labels
+        :return: function that takes a sequence of values
+        """
+
+        buffer = self.buffer
+        slots = tuple(self.slots[label] for label in labels)
+
+        def fallback(values):
+            layout = self.layout
+            for (label, value) in zip(labels, values):
+                self[label] = value
+            return self.layout != layout
+
+        if all(shape == () for (start, stop, shape) in slots):
+            index = numpy.array([start for (start, stop, shape) in slots],
+                                dtype=numpy.intp)
+            length = len(index)
+
+            def set_(values):
+                try:
+                    if len(values) == length:
+                        buffer[index] = values
+                        return
+                except (TypeError, ValueError):
+                    pass
+                return fallback(values)
+
+            return set_
+
+        def set_(values):
+            layout = self.layout
+            for (label, (start, stop, shape), value) in zip(labels, slots, values):
+                if numpy.shape(value) == shape:
+                    if shape == ():
+                        buffer[start] = value
+                    else:
+                        buffer[start:stop] = numpy.ravel(value)
+                else:
+                    self[label] = value
+            return self.layout != layout
+
+        return set_
+
+    def gather(self, labels):
+        """
+        Return a function that copies the values of the signals in
+        :py:data:`labels` into a single preallocated flat row.
+
+        The function returns a tuple `(row, dims)` where `dims` holds
+        the number of entries of each signal in `row`.
+
+        :param list labels: the signal labels
+        :return: function with no arguments
+        """
+
+        buffer = self.buffer
+        slots = tuple(self.slots[label] for label in labels)
+
+        index = numpy.hstack([numpy.arange(start, stop, dtype=numpy.intp)
+                              for (start, stop, shape) in slots]) \
+            if slots else numpy.zeros(0, dtype=numpy.intp)
+        dims = tuple(stop - start for (start, stop, shape) in slots)
+        row = numpy.zeros(index.shape[0], dtype=numpy.float64)
+        retval = (row, dims)
+
+        def get():
+            buffer.take(index, out=row)
+            return retval
+
+        return get
@@ -505,6 +505,151 @@ class TestUnittestAssertions(unittest.TestCase):
 
         self.assertTrue( values == (None,) )
     
+    def test_plan(self):
+
+        from pyctrl.block.container import Container, Input, Output
+        from pyctrl.block.system import Gain
+
+        container = Container()
+
+        container.add_signals('s1', 's2', 's3')
+
+        container.add_source('input1',
+                             Input(),
+                             ['s1'])
+
+        container.add_filter('gain1',
+                             Gain(gain = 3),
+                             ['s1'],['s2'])
+
+        container.add_sink('output1',
+                           Output(),
+                           ['s2'])
+
+        self.assertTrue( container.plan is None )
+
+        container.set_enabled(True)
+        container.write(1)
+        values = container.read()
+        container.set_enabled(False)
+
+        self.assertTrue( values == (3,) )
+
+        # plan is compiled once
+        plan = container.plan
+        self.assertTrue( plan is not None )
+        (sources, filters, sinks) = plan
+        self.assertEqual( len(sources), 1 )
+        self.assertEqual( len(filters), 1 )
+        self.assertEqual( len(sinks), 1 )
+
+        container.set_enabled(True)
+        container.write(2)
+        values = container.read()
+        container.set_enabled(False)
+
+        self.assertTrue( values == (6,) )
+        self.assertTrue( container.plan is plan )
+
+        # setting attributes does not invalidate plan
+        container.set_filter('gain1', gain = 5)
+        self.assertTrue( container.plan is plan )
+
+        # changing topology invalidates plan
+        container.set_filter('gain1', outputs = ['s3'])
+        self.assertTrue( container.plan is None )
+
+        container.add_filter('gain2',
+                             Gain(gain = 2),
+                             ['s3'],['s2'])
+        self.assertTrue( container.plan is None )
+
+        container.set_enabled(True)
+        container.write(1)
+        values = container.read()
+        container.set_enabled(False)
+
+        self.assertTrue( values == (10,) )
+
+        container.remove_filter('gain2')
+        self.assertTrue( container.plan is None )
+
+        # plan is not exported
+        self.assertTrue( 'plan' not in container.get() )
+
+    def test_signal_table(self):
+
+        import numpy
+        import pyctrl.block as block
+        from pyctrl.block.container import Container, Input, Output
+        from pyctrl.block.system import Gain
+        from pyctrl.block.table import SignalTable
+
+        container = Container(signal_table = True)
+        self.assertTrue( isinstance(container.signals, SignalTable) )
+
+        container.add_signals('s1', 's2', 's3')
+        self.assertEqual( sorted(container.list_signals()), ['s1', 's2', 's3'] )
+        self.assertEqual( container.get_signal('s1'), 0 )
+
+        container.set_signal('s1', 1.5)
+        self.assertEqual( container.get_signal('s1'), 1.5 )
+        self.assertEqual( container.get_signals('s1', 's2'), [1.5, 0] )
+
+        # vector signals
+        container.set_signal('s3', numpy.array([1, 2]))
+        self.assertTrue( numpy.array_equal(container.get_signal('s3'), [1, 2]) )
+
+        # non numeric signals are not allowed
+        with self.assertRaises(block.BlockException):
+            container.set_signal('s2', 'abc')
+
+        container.remove_signal('s3')
+        self.assertTrue( 's3' not in container.list_signals() )
+
+        container.add_signals('v1', 'v2')
+        container.add_source('input1',
+                             Input(),
+                             ['s1'])
+
+        container.add_filter('gain1',
+                             Gain(gain = 3),
+                             ['s1'],['s2'])
+
+        container.add_filter('gain2',
+                             Gain(gain = numpy.array([1, 2])),
+                             ['s1'],['v1'])
+
+        container.add_filter('gain3',
+                             Gain(gain = 2),
+                             ['v1'],['v2'])
+
+        container.add_sink('output1',
+                           Output(),
+                           ['s2'])
+
+        container.add_sink('logger',
+                           block.Logger(),
+                           ['s1', 's2', 'v2'])
+
+        container.set_enabled(True)
+        for k in range(3):
+            container.write(k + 1)
+            values = container.read()
+        container.set_enabled(False)
+
+        self.assertTrue( values == (9,) )
+        self.assertTrue( numpy.array_equal(container.get_signal('v2'), [6, 12]) )
+
+        log = container.get_sink('logger', 'log')
+        self.assertTrue( numpy.array_equal(log['s1'], [[1], [2], [3]]) )
+        self.assertTrue( numpy.array_equal(log['s2'], [[3], [6], [9]]) )
+        self.assertTrue( numpy.array_equal(log['v2'], [[2, 4], [4, 8], [6, 12]]) )
+
+        # signals are exported as a dictionary
+        self.assertTrue( isinstance(container.get('signals'), dict) )
+        self.assertTrue( isinstance(container.get()['signals'], dict) )
+
     def test_sub_container(self):
 
         from pyctrl.block.container import Container, Input, Output, ContainerException